@@ -16,16 +16,51 @@ Usage:
 The script will expand sections and slides based on your outline structure.
 """
 
-import tempfile
+import copy
+import functools
+import importlib.machinery
+import io
+import logging
+import multiprocessing
+import re
+import shutil
+import sys
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import BinaryIO, Union
 
 from pptx import Presentation
 from pptx.util import Pt
 from pptx.dml.color import RGBColor
-from pptx.oxml.ns import qn
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 from lxml import etree
 
+log = logging.getLogger(__name__)
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """
+    Log handler for stdout that leaves flushing to the stream's own buffering,
+    so piped progress output is written in blocks rather than once per record.
+    create_presentation() flushes once after saving.
+    """
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    def flush(self):
+        pass
+
+
+def _flush_log_streams():
+    """Flush the streams behind the root logger's handlers."""
+    for handler in logging.getLogger().handlers:
+        stream = getattr(handler, "stream", None)
+        if stream is not None:
+            stream.flush()
+
 
 # =============================================================================
 # CONFIGURATION — CUSTOMISE THESE FOR YOUR TEMPLATE
@@ -66,42 +101,200 @@ FIXED_LAYOUTS = ["about", "cta"]
 BODY_PLACEHOLDER_IDX = 13
 
 
+# =============================================================================
+# XML TAG NAMES
+# =============================================================================
+
+_A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_NS = {"a": _A_NS, "p": _P_NS}
+
+
+def _a(tag: str) -> str:
+    """Clark-notation name for a DrawingML (a:) tag."""
+    return f"{{{_A_NS}}}{tag}"
+
+
+def _p(tag: str) -> str:
+    """Clark-notation name for a PresentationML (p:) tag."""
+    return f"{{{_P_NS}}}{tag}"
+
+
+# Namespace-qualified tags, resolved once at import rather than per call in loops
+_A_P = _a('p')
+_A_R = _a('r')
+_A_BR = _a('br')
+_A_SOLIDFILL = _a('solidFill')
+_A_SRGBCLR = _a('srgbClr')
+_A_LATIN = _a('latin')
+_A_T = _a('t')
+_P_SP = _p('sp')
+_P_TXBODY = _p('txBody')
+_P_TIMING = _p('timing')
+_P_TNLST = _p('tnLst')
+_P_PAR = _p('par')
+_P_CTN = _p('cTn')
+_P_CHILDTNLST = _p('childTnLst')
+_P_SEQ = _p('seq')
+_P_PREVCONDLST = _p('prevCondLst')
+_P_NEXTCONDLST = _p('nextCondLst')
+_P_COND = _p('cond')
+_P_TGTEL = _p('tgtEl')
+_P_SLDTGT = _p('sldTgt')
+_P_BLDLST = _p('bldLst')
+_P_BLDP = _p('bldP')
+_P_TXEL = _p('txEl')
+_P_PRG = _p('pRg')
+
+
 # =============================================================================
 # TEMPLATE CONVERSION
 # =============================================================================
 
-def convert_potx_to_pptx(potx_path: Path, pptx_path: Path):
-    """Convert .potx template to .pptx by updating content type."""
+def convert_potx_to_pptx(potx_path: Path, pptx_file: Union[Path, BinaryIO]):
+    """
+    Convert .potx template to .pptx by updating content type.
+
+    pptx_file may be a path or a writable binary file object such as
+    io.BytesIO, so the conversion can stay in memory.
+    """
     with zipfile.ZipFile(potx_path, "r") as zin:
-        with zipfile.ZipFile(pptx_path, "w", zipfile.ZIP_DEFLATED) as zout:
+        with zipfile.ZipFile(pptx_file, "w", zipfile.ZIP_DEFLATED) as zout:
             for item in zin.infolist():
-                data = zin.read(item.filename)
                 if item.filename == "[Content_Types].xml":
-                    data = data.replace(
+                    data = zin.read(item).replace(
                         b"application/vnd.openxmlformats-officedocument.presentationml.template.main+xml",
                         b"application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml"
                     )
-                zout.writestr(item, data)
+                    zout.writestr(item, data)
+                else:
+                    # Stream untouched parts (media, fonts) instead of reading them whole
+                    with zin.open(item) as src, zout.open(item, "w") as dst:
+                        shutil.copyfileobj(src, dst, length=1 << 20)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_converted_template_bytes(path: str, mtime: float) -> bytes:
+    """
+    Return the template converted to .pptx as bytes, built in memory.
+    mtime is part of the cache key so an edited template is re-converted.
+    """
+    buf = io.BytesIO()
+    convert_potx_to_pptx(Path(path), buf)
+    return buf.getvalue()
+
+
+class PresentationFactory:
+    """
+    Hands out fresh Presentation objects from one converted template.
+
+    The template is converted and held as bytes once; each new() parses a
+    new Presentation from them. Share one factory across a batch:
+
+        factory = PresentationFactory(TEMPLATE_PATH)
+        for outline, path in jobs:
+            create_presentation(outline, path, factory=factory)
+    """
+
+    def __init__(self, potx_path: Path):
+        potx_path = Path(potx_path)
+        if not potx_path.exists():
+            raise FileNotFoundError(f"Template not found: {potx_path}")
+        self._bytes = _load_converted_template_bytes(str(potx_path), potx_path.stat().st_mtime)
+
+    def new(self) -> Presentation:
+        """Return a new, independent Presentation of the template."""
+        return Presentation(io.BytesIO(self._bytes))
 
 
 # =============================================================================
 # TEXT FORMATTING
 # =============================================================================
 
+# Control characters (other than tab/newline) are escaped as _xHHHH_ in run text
+_CTRL_CHARS = re.compile(r"[\x00-\x08\x0B-\x1F]")
+
+# Paragraph prototypes, parsed once and deep-copied per paragraph.
+# Run properties and text are filled in by the caller / _text_para().
+_RUN_XML = '<a:r><a:t/></a:r>'
+_LINE_SPACING_XML = '<a:lnSpc><a:spcPct val="120000"/></a:lnSpc>'
+
+_LINE_PARA_PROTO = parse_xml(
+    f'<a:p {nsdecls("a")}><a:pPr>{_LINE_SPACING_XML}</a:pPr></a:p>'
+)
+_INTRO_PARA_PROTO = parse_xml(
+    f'<a:p {nsdecls("a")}><a:pPr>{_LINE_SPACING_XML}</a:pPr>{_RUN_XML}</a:p>'
+)
+_EMPTY_PARA_PROTO = parse_xml(
+    f'<a:p {nsdecls("a")}><a:pPr>{_LINE_SPACING_XML}</a:pPr><a:endParaRPr dirty="0"/></a:p>'
+)
+# Arrow bullet: Ø in Wingdings
+_BULLET_PARA_PROTO = parse_xml(
+    f'<a:p {nsdecls("a")}><a:pPr marL="342900" indent="-342900">{_LINE_SPACING_XML}'
+    '<a:buFont typeface="Wingdings" pitchFamily="2" charset="2"/><a:buChar char="\u00D8"/>'
+    f'</a:pPr>{_RUN_XML}</a:p>'
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _make_rPr(colour_val: str, typeface: str):
+    """
+    Build the shared body run properties for one colour/typeface pair.
+    Cached: callers must deepcopy the result, never modify it.
+    """
+    rPr = parse_xml(
+        f'<a:rPr {nsdecls("a")} sz="2200" dirty="0">'
+        '<a:solidFill><a:srgbClr/></a:solidFill><a:latin/></a:rPr>'
+    )
+    rPr.find('.//' + _A_SRGBCLR).set('val', colour_val)
+    rPr.find(_A_LATIN).set('typeface', typeface)
+    return rPr
+
+
+def _text_para(proto, text: str, rPr):
+    """Copy a paragraph prototype, give its run a copy of rPr and set its text."""
+    p = copy.deepcopy(proto)
+    r = p.find(_A_R)
+    r.insert(0, copy.deepcopy(rPr))
+    r.find(_A_T).text = text
+    return p
+
+
 def set_text_simple(placeholder, text: str, is_light_bg: bool = False, font_size: int = None):
     """
     Set text with typography and 1.2 line spacing (no bullets).
     Use for titles and subtitles.
+
+    Writes the txBody directly, splitting lines into paragraphs and line
+    breaks the same way assigning placeholder.text does.
     """
-    placeholder.text = text
-    for paragraph in placeholder.text_frame.paragraphs:
-        paragraph.line_spacing = 1.2
-        for run in paragraph.runs:
-            run.font.name = FONT_FAMILY
-            if font_size:
-                run.font.size = Pt(font_size)
-            if is_light_bg:
-                run.font.color.rgb = ACCENT_COLOUR
+    txBody = placeholder._element.get_or_add_txBody()
+
+    # Remove existing paragraphs
+    for p in txBody.findall(_A_P):
+        txBody.remove(p)
+
+    rPr = parse_xml(f'<a:rPr {nsdecls("a")}/>')
+    if font_size:
+        rPr.set('sz', str(Pt(font_size).centipoints))
+    if is_light_bg:
+        fill = etree.SubElement(rPr, _A_SOLIDFILL)
+        etree.SubElement(fill, _A_SRGBCLR, val=str(ACCENT_COLOUR))
+    etree.SubElement(rPr, _A_LATIN, typeface=FONT_FAMILY)
+
+    for line in text.split("\n"):
+        p = copy.deepcopy(_LINE_PARA_PROTO)
+        # Vertical tab is a soft line break within the paragraph
+        for idx, run_text in enumerate(line.split("\v")):
+            if idx > 0:
+                etree.SubElement(p, _A_BR)
+            if run_text:
+                r = etree.SubElement(p, _A_R)
+                r.append(copy.deepcopy(rPr))
+                etree.SubElement(r, _A_T).text = _CTRL_CHARS.sub(
+                    lambda m: "_x%04X_" % ord(m.group()), run_text
+                )
+        txBody.append(p)
 
 
 def set_body_with_bullets(placeholder, intro_text: str, bullets: list, is_light_bg: bool = False):
@@ -114,54 +307,22 @@ def set_body_with_bullets(placeholder, intro_text: str, bullets: list, is_light_
         - Arrow bullet points
     """
     placeholder.text = ""
-    txBody = placeholder._element.find(qn('p:txBody'))
+    txBody = placeholder._element.find(_P_TXBODY)
     if txBody is None:
         return
 
     # Remove existing paragraphs
-    for p in txBody.findall(qn('a:p')):
+    for p in txBody.findall(_A_P):
         txBody.remove(p)
 
     colour_val = ACCENT_HEX if is_light_bg else "FFFFFF"
+    rPr = _make_rPr(colour_val, FONT_FAMILY)
 
-    # Paragraph 1: Intro text
-    intro_p = etree.SubElement(txBody, qn('a:p'))
-    intro_pPr = etree.SubElement(intro_p, qn('a:pPr'))
-    intro_lnSpc = etree.SubElement(intro_pPr, qn('a:lnSpc'))
-    etree.SubElement(intro_lnSpc, qn('a:spcPct'), val="120000")
-
-    intro_r = etree.SubElement(intro_p, qn('a:r'))
-    intro_rPr = etree.SubElement(intro_r, qn('a:rPr'), sz="2200", dirty="0")
-    intro_fill = etree.SubElement(intro_rPr, qn('a:solidFill'))
-    etree.SubElement(intro_fill, qn('a:srgbClr'), val=colour_val)
-    etree.SubElement(intro_rPr, qn('a:latin'), typeface=FONT_FAMILY)
-    intro_t = etree.SubElement(intro_r, qn('a:t'))
-    intro_t.text = intro_text
-
-    # Paragraph 2: Empty line for spacing
-    empty_p = etree.SubElement(txBody, qn('a:p'))
-    empty_pPr = etree.SubElement(empty_p, qn('a:pPr'))
-    empty_lnSpc = etree.SubElement(empty_pPr, qn('a:lnSpc'))
-    etree.SubElement(empty_lnSpc, qn('a:spcPct'), val="120000")
-    etree.SubElement(empty_p, qn('a:endParaRPr'), dirty="0")
-
-    # Bullet paragraphs with arrow (Wingdings Ø)
+    # Intro text, empty line for spacing, then arrow bullets
+    txBody.append(_text_para(_INTRO_PARA_PROTO, intro_text, rPr))
+    txBody.append(copy.deepcopy(_EMPTY_PARA_PROTO))
     for bullet_text in bullets:
-        bullet_p = etree.SubElement(txBody, qn('a:p'))
-        bullet_pPr = etree.SubElement(bullet_p, qn('a:pPr'), marL="342900", indent="-342900")
-        bullet_lnSpc = etree.SubElement(bullet_pPr, qn('a:lnSpc'))
-        etree.SubElement(bullet_lnSpc, qn('a:spcPct'), val="120000")
-        # Arrow bullet using Wingdings
-        etree.SubElement(bullet_pPr, qn('a:buFont'), typeface="Wingdings", pitchFamily="2", charset="2")
-        etree.SubElement(bullet_pPr, qn('a:buChar'), char="\u00D8")  # Ø = arrow in Wingdings
-
-        bullet_r = etree.SubElement(bullet_p, qn('a:r'))
-        bullet_rPr = etree.SubElement(bullet_r, qn('a:rPr'), sz="2200", dirty="0")
-        bullet_fill = etree.SubElement(bullet_rPr, qn('a:solidFill'))
-        etree.SubElement(bullet_fill, qn('a:srgbClr'), val=colour_val)
-        etree.SubElement(bullet_rPr, qn('a:latin'), typeface=FONT_FAMILY)
-        bullet_t = etree.SubElement(bullet_r, qn('a:t'))
-        bullet_t.text = bullet_text
+        txBody.append(_text_para(_BULLET_PARA_PROTO, bullet_text, rPr))
 
 
 # =============================================================================
@@ -173,10 +334,136 @@ def add_slide(prs: Presentation, layout_key: str):
     return prs.slides.add_slide(prs.slide_layouts[LAYOUTS[layout_key]])
 
 
+def _phmap(slide) -> dict:
+    """Map placeholder idx to placeholder in a single walk of the shape tree."""
+    return {ph.placeholder_format.idx: ph for ph in slide.placeholders}
+
+
 # =============================================================================
 # ANIMATIONS
 # =============================================================================
 
+_XML_PARSER = etree.XMLParser(remove_blank_text=True)
+
+# Click-triggered dissolve for a whole shape. IDs and spid are placeholders,
+# patched per shape by _dissolve_par(); parsed once at import.
+_PAR_SIMPLE_XML = f'''
+<p:par xmlns:p="{_P_NS}">
+    <p:cTn id="0" fill="hold">
+        <p:stCondLst>
+            <p:cond delay="indefinite"/>
+        </p:stCondLst>
+        <p:childTnLst>
+            <p:par>
+                <p:cTn id="0" fill="hold">
+                    <p:stCondLst>
+                        <p:cond delay="0"/>
+                    </p:stCondLst>
+                    <p:childTnLst>
+                        <p:par>
+                            <p:cTn id="0" presetID="9" presetClass="entr" presetSubtype="0" fill="hold" grpId="0" nodeType="clickEffect">
+                                <p:stCondLst>
+                                    <p:cond delay="0"/>
+                                </p:stCondLst>
+                                <p:childTnLst>
+                                    <p:set>
+                                        <p:cBhvr>
+                                            <p:cTn id="0" dur="1" fill="hold">
+                                                <p:stCondLst>
+                                                    <p:cond delay="0"/>
+                                                </p:stCondLst>
+                                            </p:cTn>
+                                            <p:tgtEl>
+                                                <p:spTgt spid="0"/>
+                                            </p:tgtEl>
+                                            <p:attrNameLst>
+                                                <p:attrName>style.visibility</p:attrName>
+                                            </p:attrNameLst>
+                                        </p:cBhvr>
+                                        <p:to>
+                                            <p:strVal val="visible"/>
+                                        </p:to>
+                                    </p:set>
+                                    <p:animEffect transition="in" filter="dissolve">
+                                        <p:cBhvr>
+                                            <p:cTn id="0" dur="500"/>
+                                            <p:tgtEl>
+                                                <p:spTgt spid="0"/>
+                                            </p:tgtEl>
+                                        </p:cBhvr>
+                                    </p:animEffect>
+                                </p:childTnLst>
+                            </p:cTn>
+                        </p:par>
+                    </p:childTnLst>
+                </p:cTn>
+            </p:par>
+        </p:childTnLst>
+    </p:cTn>
+</p:par>
+'''
+
+_find_cnvpr = etree.XPath("p:nvSpPr/p:cNvPr", namespaces=_NS)
+_find_ph = etree.XPath("p:nvSpPr/p:nvPr/p:ph", namespaces=_NS)
+_find_ctns = etree.XPath(".//p:cTn", namespaces=_NS)
+_find_sptgts = etree.XPath(".//p:spTgt", namespaces=_NS)
+_find_prgs = etree.XPath(".//p:pRg", namespaces=_NS)
+
+
+def _paragraph_targeted(par):
+    """Copy of a dissolve block with each spTgt narrowed to a paragraph range."""
+    par = copy.deepcopy(par)
+    for sp_tgt in _find_sptgts(par):
+        etree.SubElement(etree.SubElement(sp_tgt, _P_TXEL), _P_PRG, st="0", end="0")
+    return par
+
+
+_PAR_SIMPLE_TEMPLATE = etree.fromstring(_PAR_SIMPLE_XML, _XML_PARSER)
+# Same block targeting a single paragraph range (pRg) within the shape
+_PAR_BODY_TEMPLATE = _paragraph_targeted(_PAR_SIMPLE_TEMPLATE)
+
+
+def _dissolve_par(template, base_id: int, spid: int, para_idx: int = None):
+    """Copy a pre-parsed dissolve block and patch its IDs and target."""
+    par = copy.deepcopy(template)
+    # cTn nodes in document order take base_id .. base_id + 4
+    for offset, ctn in enumerate(_find_ctns(par)):
+        ctn.set("id", str(base_id + offset))
+    for sp_tgt in _find_sptgts(par):
+        sp_tgt.set("spid", str(spid))
+    if para_idx is not None:
+        for p_rg in _find_prgs(par):
+            p_rg.set("st", str(para_idx))
+            p_rg.set("end", str(para_idx))
+    return par
+
+
+def _add_timing(sld):
+    """
+    Replace any existing <p:timing> on the slide element with an empty
+    tmRoot > mainSeq skeleton. Returns (mainSeq childTnLst, bldLst).
+    """
+    existing = sld.find(_P_TIMING)
+    if existing is not None:
+        sld.remove(existing)
+
+    # tmRoot > mainSeq, plus prev/next triggers
+    timing = etree.SubElement(sld, _P_TIMING)
+    root_par = etree.SubElement(etree.SubElement(timing, _P_TNLST), _P_PAR)
+    root_ctn = etree.SubElement(
+        root_par, _P_CTN, id="1", dur="indefinite", restart="never", nodeType="tmRoot"
+    )
+    seq = etree.SubElement(
+        etree.SubElement(root_ctn, _P_CHILDTNLST), _P_SEQ, concurrent="1", nextAc="seek"
+    )
+    main_ctn = etree.SubElement(seq, _P_CTN, id="2", dur="indefinite", nodeType="mainSeq")
+    main_seq = etree.SubElement(main_ctn, _P_CHILDTNLST)
+    for cond_lst, evt in ((_P_PREVCONDLST, 'onPrev'), (_P_NEXTCONDLST, 'onNext')):
+        cond = etree.SubElement(etree.SubElement(seq, cond_lst), _P_COND, evt=evt, delay="0")
+        etree.SubElement(etree.SubElement(cond, _P_TGTEL), _P_SLDTGT)
+    return main_seq, etree.SubElement(timing, _P_BLDLST)
+
+
 def add_dissolve_animations(slide):
     """
     Add 0.5s dissolve on-click animation to all text elements.
@@ -189,218 +476,83 @@ def add_dissolve_animations(slide):
     Do NOT call this for fixed slides (About, CTA) — they have
     pre-set animations in the template.
     """
-    shapes_info = []
+    main_seq = None
+    ctn_id = 1
 
-    for shape in slide.shapes:
-        if not hasattr(shape, 'text_frame'):
-            continue
-        spid = shape.shape_id
-        para_count = len(shape.text_frame.paragraphs)
+    # Only p:sp shapes carry a text frame
+    for sp in slide.shapes._spTree.iterchildren(_P_SP):
+        spid = int(_find_cnvpr(sp)[0].get('id'))
+        txBody = sp.find(_P_TXBODY)
+        para_count = len(txBody.findall(_A_P)) if txBody is not None else 0
 
-        # Check if this should animate by paragraph
+        # Check if this should animate by paragraph (placeholder idx defaults to 0)
         is_body = False
-        try:
-            if hasattr(shape, 'placeholder_format') and shape.placeholder_format is not None:
-                idx = shape.placeholder_format.idx
-                if idx >= 10 or idx == 1:  # Body or subtitle
-                    is_body = True
-        except:
-            pass
-
-        shapes_info.append((spid, para_count, is_body))
-
-    if not shapes_info:
-        return
+        ph = _find_ph(sp)
+        if ph:
+            idx = int(ph[0].get('idx', 0))
+            if idx >= 10 or idx == 1:  # Body or subtitle
+                is_body = True
 
-    # Build animation XML
-    ctn_id = 1
-    child_pars = []
-    bld_items = []
+        if main_seq is None:
+            main_seq, bld_lst = _add_timing(slide._element)
 
-    for spid, para_count, is_body in shapes_info:
         if is_body and para_count > 1:
             for para_idx in range(para_count):
                 ctn_id += 1
-                base_id = ctn_id
-
-                par_xml = f'''
-                <p:par xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main">
-                    <p:cTn id="{base_id}" fill="hold">
-                        <p:stCondLst>
-                            <p:cond delay="indefinite"/>
-                        </p:stCondLst>
-                        <p:childTnLst>
-                            <p:par>
-                                <p:cTn id="{base_id + 1}" fill="hold">
-                                    <p:stCondLst>
-                                        <p:cond delay="0"/>
-                                    </p:stCondLst>
-                                    <p:childTnLst>
-                                        <p:par>
-                                            <p:cTn id="{base_id + 2}" presetID="9" presetClass="entr" presetSubtype="0" fill="hold" grpId="0" nodeType="clickEffect">
-                                                <p:stCondLst>
-                                                    <p:cond delay="0"/>
-                                                </p:stCondLst>
-                                                <p:childTnLst>
-                                                    <p:set>
-                                                        <p:cBhvr>
-                                                            <p:cTn id="{base_id + 3}" dur="1" fill="hold">
-                                                                <p:stCondLst>
-                                                                    <p:cond delay="0"/>
-                                                                </p:stCondLst>
-                                                            </p:cTn>
-                                                            <p:tgtEl>
-                                                                <p:spTgt spid="{spid}">
-                                                                    <p:txEl>
-                                                                        <p:pRg st="{para_idx}" end="{para_idx}"/>
-                                                                    </p:txEl>
-                                                                </p:spTgt>
-                                                            </p:tgtEl>
-                                                            <p:attrNameLst>
-                                                                <p:attrName>style.visibility</p:attrName>
-                                                            </p:attrNameLst>
-                                                        </p:cBhvr>
-                                                        <p:to>
-                                                            <p:strVal val="visible"/>
-                                                        </p:to>
-                                                    </p:set>
-                                                    <p:animEffect transition="in" filter="dissolve">
-                                                        <p:cBhvr>
-                                                            <p:cTn id="{base_id + 4}" dur="500"/>
-                                                            <p:tgtEl>
-                                                                <p:spTgt spid="{spid}">
-                                                                    <p:txEl>
-                                                                        <p:pRg st="{para_idx}" end="{para_idx}"/>
-                                                                    </p:txEl>
-                                                                </p:spTgt>
-                                                            </p:tgtEl>
-                                                        </p:cBhvr>
-                                                    </p:animEffect>
-                                                </p:childTnLst>
-                                            </p:cTn>
-                                        </p:par>
-                                    </p:childTnLst>
-                                </p:cTn>
-                            </p:par>
-                        </p:childTnLst>
-                    </p:cTn>
-                </p:par>
-                '''
-                child_pars.append(par_xml)
+                main_seq.append(_dissolve_par(_PAR_BODY_TEMPLATE, ctn_id, spid, para_idx))
                 ctn_id += 4
 
-            bld_items.append(f'<p:bldP spid="{spid}" grpId="0" build="p"/>')
+            etree.SubElement(bld_lst, _P_BLDP, spid=str(spid), grpId="0", build="p")
         else:
             ctn_id += 1
-            base_id = ctn_id
-
-            par_xml = f'''
-            <p:par xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main">
-                <p:cTn id="{base_id}" fill="hold">
-                    <p:stCondLst>
-                        <p:cond delay="indefinite"/>
-                    </p:stCondLst>
-                    <p:childTnLst>
-                        <p:par>
-                            <p:cTn id="{base_id + 1}" fill="hold">
-                                <p:stCondLst>
-                                    <p:cond delay="0"/>
-                                </p:stCondLst>
-                                <p:childTnLst>
-                                    <p:par>
-                                        <p:cTn id="{base_id + 2}" presetID="9" presetClass="entr" presetSubtype="0" fill="hold" grpId="0" nodeType="clickEffect">
-                                            <p:stCondLst>
-                                                <p:cond delay="0"/>
-                                            </p:stCondLst>
-                                            <p:childTnLst>
-                                                <p:set>
-                                                    <p:cBhvr>
-                                                        <p:cTn id="{base_id + 3}" dur="1" fill="hold">
-                                                            <p:stCondLst>
-                                                                <p:cond delay="0"/>
-                                                            </p:stCondLst>
-                                                        </p:cTn>
-                                                        <p:tgtEl>
-                                                            <p:spTgt spid="{spid}"/>
-                                                        </p:tgtEl>
-                                                        <p:attrNameLst>
-                                                            <p:attrName>style.visibility</p:attrName>
-                                                        </p:attrNameLst>
-                                                    </p:cBhvr>
-                                                    <p:to>
-                                                        <p:strVal val="visible"/>
-                                                    </p:to>
-                                                </p:set>
-                                                <p:animEffect transition="in" filter="dissolve">
-                                                    <p:cBhvr>
-                                                        <p:cTn id="{base_id + 4}" dur="500"/>
-                                                        <p:tgtEl>
-                                                            <p:spTgt spid="{spid}"/>
-                                                        </p:tgtEl>
-                                                    </p:cBhvr>
-                                                </p:animEffect>
-                                            </p:childTnLst>
-                                        </p:cTn>
-                                    </p:par>
-                                </p:childTnLst>
-                            </p:cTn>
-                        </p:par>
-                    </p:childTnLst>
-                </p:cTn>
-            </p:par>
-            '''
-            child_pars.append(par_xml)
+            main_seq.append(_dissolve_par(_PAR_SIMPLE_TEMPLATE, ctn_id, spid))
             ctn_id += 4
-            bld_items.append(f'<p:bldP spid="{spid}" grpId="0"/>')
+            etree.SubElement(bld_lst, _P_BLDP, spid=str(spid), grpId="0")
 
-    all_pars = ''.join(child_pars)
-    all_blds = ''.join(bld_items)
 
-    timing_xml = f'''
-    <p:timing xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main">
-        <p:tnLst>
-            <p:par>
-                <p:cTn id="1" dur="indefinite" restart="never" nodeType="tmRoot">
-                    <p:childTnLst>
-                        <p:seq concurrent="1" nextAc="seek">
-                            <p:cTn id="2" dur="indefinite" nodeType="mainSeq">
-                                <p:childTnLst>
-                                    {all_pars}
-                                </p:childTnLst>
-                            </p:cTn>
-                            <p:prevCondLst>
-                                <p:cond evt="onPrev" delay="0">
-                                    <p:tgtEl>
-                                        <p:sldTgt/>
-                                    </p:tgtEl>
-                                </p:cond>
-                            </p:prevCondLst>
-                            <p:nextCondLst>
-                                <p:cond evt="onNext" delay="0">
-                                    <p:tgtEl>
-                                        <p:sldTgt/>
-                                    </p:tgtEl>
-                                </p:cond>
-                            </p:nextCondLst>
-                        </p:seq>
-                    </p:childTnLst>
-                </p:cTn>
-            </p:par>
-        </p:tnLst>
-        <p:bldLst>
-            {all_blds}
-        </p:bldLst>
-    </p:timing>
-    '''
-
-    try:
-        timing_elm = etree.fromstring(timing_xml)
-        existing = slide._element.find(qn('p:timing'))
-        if existing is not None:
-            slide._element.remove(existing)
-        slide._element.append(timing_elm)
-    except Exception as e:
-        print(f"  Warning: Animation error: {e}")
+# =============================================================================
+# SLIDE BUILDERS
+# =============================================================================
+#
+# One builder per outline slide "type". Each receives the presentation, the
+# slide dict from the outline and whether it falls on a pale alternation step,
+# adds the slide, and returns (label for progress output, whether it used the
+# alternation step). Only builders that return True advance white/pale.
+
+def _build_content_slide(prs: Presentation, content: dict, is_pale: bool) -> tuple:
+    """Title + subtitle + body (intro paragraph and arrow bullets)."""
+    layout_key = content.get("layout")
+    if layout_key is None:
+        layout_key = "content_pale" if is_pale else "content_white"
+
+    slide = add_slide(prs, layout_key)
+    ph = _phmap(slide)
+    set_text_simple(ph[0], content["title"], is_light_bg=True)
+    set_text_simple(ph[1], content["subtitle"], is_light_bg=True)
+    set_body_with_bullets(
+        ph[BODY_PLACEHOLDER_IDX],
+        content["intro"],
+        content["bullets"],
+        is_light_bg=True
+    )
+    add_dissolve_animations(slide)
+    return content["title"], True
+
+
+def _build_quote_slide(prs: Presentation, content: dict, is_pale: bool) -> tuple:
+    """Quote + attribution."""
+    slide = add_slide(prs, "quote")
+    ph = _phmap(slide)
+    set_text_simple(ph[0], content["quote"], is_light_bg=True)
+    set_text_simple(ph[1], content.get("attribution", ""), is_light_bg=True)
+    add_dissolve_animations(slide)
+    return "Quote", False
+
+
+SLIDE_BUILDERS = {
+    "content": _build_content_slide,
+    "quote": _build_quote_slide,
+}
 
 
 # =============================================================================
@@ -410,7 +562,7 @@ def add_dissolve_animations(slide):
 # The script generates slides dynamically from this outline.
 # Modify the OUTLINE dict to change presentation content.
 #
-# Supported slide types:
+# Supported slide types (see SLIDE_BUILDERS):
 #   - "content": Title + Subtitle + Body (intro paragraph + bullets)
 #   - "quote": Quote slide
 #
@@ -502,136 +654,195 @@ OUTLINE = {
 # PRESENTATION CREATION
 # =============================================================================
 
-def create_presentation(outline: dict = None, output_path: Path = None):
+def create_presentation(outline: dict = None, output_path: Path = None,
+                        factory: PresentationFactory = None):
     """
     Create presentation from structured outline.
 
     Args:
         outline: Presentation outline dict. Uses OUTLINE constant if not provided.
         output_path: Where to save the output. Uses OUTPUT_PATH if not provided.
+        factory: Source of template Presentations, for batch runs. Built from
+            TEMPLATE_PATH if not provided.
     """
     if outline is None:
         outline = OUTLINE
     if output_path is None:
         output_path = OUTPUT_PATH
+    if factory is None:
+        # Conversion is cached per template file and modification time
+        factory = PresentationFactory(TEMPLATE_PATH)
+
+    prs = factory.new()
+
+    # Remove all existing slides: drop each relationship, then clear the list once
+    sldIdLst = prs.slides._sldIdLst
+    if len(sldIdLst):
+        part = prs.part
+        for rId in [sldId.rId for sldId in sldIdLst]:
+            part.drop_rel(rId)
+        del sldIdLst[:]
+
+    # Bind functions used per slide to locals (fast lookups in the section loop)
+    new_slide = add_slide
+    phmap = _phmap
+    set_text = set_text_simple
+    animate = add_dissolve_animations
+    builders = SLIDE_BUILDERS
+    info = log.info
+
+    slide_num = 0
+    alternation_step = 0  # For alternating white/pale
+
+    # === FIXED OPENING SEQUENCE ===
+
+    # Title slide
+    slide_num += 1
+    slide = new_slide(prs, "title")
+    ph = phmap(slide)
+    set_text(ph[0], outline["title"])
+    set_text(ph[1], outline["subtitle"])
+    animate(slide)
+    info("%d. Title slide", slide_num)
+
+    # Agenda slide — auto-generate from section names
+    slide_num += 1
+    slide = new_slide(prs, "menu")
+    ph = phmap(slide)
+    set_text(ph[0], "AGENDA", is_light_bg=True)
+    agenda_text = "\n".join(s["name"] for s in outline["sections"] if s.get("section_type") != "none")
+    set_text(ph[1], agenda_text, is_light_bg=True)
+    animate(slide)
+    info("%d. Agenda slide", slide_num)
+
+    # About slide (Fixed) — comment out if your template doesn't have one
+    slide_num += 1
+    slide = new_slide(prs, "about")
+    info("%d. About slide (fixed)", slide_num)
+
+    # === SECTIONS ===
+
+    for section in outline["sections"]:
+        section_type = section.get("section_type", "blue")
+
+        # Section header (unless section_type is "none")
+        if section_type != "none":
+            slide_num += 1
+            if section_type == "pale":
+                slide = new_slide(prs, "section_pale")
+                ph = phmap(slide)
+                set_text(ph[0], section["name"], is_light_bg=True)
+                set_text(ph[1], section["subtitle"], is_light_bg=True)
+            else:
+                slide = new_slide(prs, "section")
+                ph = phmap(slide)
+                set_text(ph[0], section["name"])
+                set_text(ph[1], section["subtitle"])
+            animate(slide)
+            info("%d. Section: %s", slide_num, section["name"])
+
+        # Content slides
+        for content in section.get("slides", []):
+            slide_type = content["type"]
+            if slide_type not in builders:
+                raise ValueError(f"Unknown slide type: {slide_type!r}")
+            slide_num += 1
+
+            # Alternate between white and pale across builders that use it
+            label, alternated = builders[slide_type](prs, content, alternation_step % 2 == 1)
+            if alternated:
+                alternation_step += 1
+            info("%d. %s", slide_num, label)
+
+    # === FIXED CLOSING SEQUENCE ===
+
+    # CTA slide (Fixed) — comment out if your template doesn't have one
+    slide_num += 1
+    slide = new_slide(prs, "cta")
+    info("%d. CTA (fixed)", slide_num)
+
+    # Thank You slide
+    slide_num += 1
+    slide = new_slide(prs, "thank_you")
+    ph = phmap(slide)
+    set_text(ph[0], "THANK YOU")
+    set_text(ph[1], outline.get("thank_you_subtitle", ""))
+    animate(slide)
+    info("%d. Thank You", slide_num)
+
+    # Save through a 1 MB buffer so writes reach storage in large chunks
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        prs.save(f)
+    info("Saved: %s", output_path)
+    info("Total slides: %d", len(prs.slides))
+    _flush_log_streams()
+
+
+# Module settings copied into each create_presentations() worker, so values
+# assigned at runtime reach workers that re-import the module (spawn, forkserver)
+_WORKER_CONFIG = (
+    "TEMPLATE_PATH", "OUTPUT_PATH", "ACCENT_COLOUR", "ACCENT_HEX",
+    "FONT_FAMILY", "LAYOUTS", "BODY_PLACEHOLDER_IDX",
+)
+
+
+def _workers_can_import() -> bool:
+    """
+    Whether worker processes can import this module to unpickle jobs.
+
+    Fork workers inherit it. Spawn and forkserver workers re-import it, which
+    works when it runs as __main__ or is importable by name from sys.path —
+    not when it was loaded by file path (the hyphenated file name rules out a
+    plain import).
+    """
+    if multiprocessing.get_start_method() == "fork" or __name__ == "__main__":
+        return True
+    return importlib.machinery.PathFinder.find_spec(__name__.partition(".")[0]) is not None
 
-    if not TEMPLATE_PATH.exists():
-        raise FileNotFoundError(f"Template not found: {TEMPLATE_PATH}")
-
-    # Convert template
-    with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as tmp:
-        tmp_path = Path(tmp.name)
-    convert_potx_to_pptx(TEMPLATE_PATH, tmp_path)
-
-    try:
-        prs = Presentation(str(tmp_path))
-
-        # Remove all existing slides
-        while len(prs.slides) > 0:
-            rId = prs.slides._sldIdLst[0].rId
-            prs.part.drop_rel(rId)
-            del prs.slides._sldIdLst[0]
-
-        slide_num = 0
-        content_slide_count = 0  # For alternating white/pale
-
-        # === FIXED OPENING SEQUENCE ===
-
-        # Title slide
-        slide_num += 1
-        slide = add_slide(prs, "title")
-        set_text_simple(slide.placeholders[0], outline["title"])
-        set_text_simple(slide.placeholders[1], outline["subtitle"])
-        add_dissolve_animations(slide)
-        print(f"{slide_num}. Title slide")
-
-        # Agenda slide — auto-generate from section names
-        slide_num += 1
-        slide = add_slide(prs, "menu")
-        set_text_simple(slide.placeholders[0], "AGENDA", is_light_bg=True)
-        agenda_items = [s["name"] for s in outline["sections"] if s.get("section_type") != "none"]
-        agenda_text = "\n".join(agenda_items)
-        set_text_simple(slide.placeholders[1], agenda_text, is_light_bg=True)
-        add_dissolve_animations(slide)
-        print(f"{slide_num}. Agenda slide")
-
-        # About slide (Fixed) — comment out if your template doesn't have one
-        slide_num += 1
-        slide = add_slide(prs, "about")
-        print(f"{slide_num}. About slide (fixed)")
-
-        # === SECTIONS ===
-
-        for section in outline["sections"]:
-            section_type = section.get("section_type", "blue")
-
-            # Section header (unless section_type is "none")
-            if section_type != "none":
-                slide_num += 1
-                if section_type == "pale":
-                    slide = add_slide(prs, "section_pale")
-                    set_text_simple(slide.placeholders[0], section["name"], is_light_bg=True)
-                    set_text_simple(slide.placeholders[1], section["subtitle"], is_light_bg=True)
-                else:
-                    slide = add_slide(prs, "section")
-                    set_text_simple(slide.placeholders[0], section["name"])
-                    set_text_simple(slide.placeholders[1], section["subtitle"])
-                add_dissolve_animations(slide)
-                print(f"{slide_num}. Section: {section['name']}")
-
-            # Content slides
-            for content in section.get("slides", []):
-                slide_num += 1
-
-                if content["type"] == "content":
-                    # Alternate between white and pale
-                    layout_key = content.get("layout")
-                    if layout_key is None:
-                        layout_key = "content_white" if content_slide_count % 2 == 0 else "content_pale"
-                    content_slide_count += 1
-
-                    slide = add_slide(prs, layout_key)
-                    set_text_simple(slide.placeholders[0], content["title"], is_light_bg=True)
-                    set_text_simple(slide.placeholders[1], content["subtitle"], is_light_bg=True)
-                    set_body_with_bullets(
-                        slide.placeholders[BODY_PLACEHOLDER_IDX],
-                        content["intro"],
-                        content["bullets"],
-                        is_light_bg=True
-                    )
-                    add_dissolve_animations(slide)
-                    print(f"{slide_num}. {content['title']}")
 
-                elif content["type"] == "quote":
-                    slide = add_slide(prs, "quote")
-                    set_text_simple(slide.placeholders[0], content["quote"], is_light_bg=True)
-                    set_text_simple(slide.placeholders[1], content.get("attribution", ""), is_light_bg=True)
-                    add_dissolve_animations(slide)
-                    print(f"{slide_num}. Quote")
+def _init_worker(config: dict, log_level: int):
+    """Apply the parent's settings and log level in a worker process."""
+    config = dict(config, ACCENT_COLOUR=RGBColor.from_string(config["ACCENT_COLOUR"]))
+    globals().update(config)
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=log_level, format="%(message)s", handlers=[_StdoutHandler()])
 
-        # === FIXED CLOSING SEQUENCE ===
 
-        # CTA slide (Fixed) — comment out if your template doesn't have one
-        slide_num += 1
-        slide = add_slide(prs, "cta")
-        print(f"{slide_num}. CTA (fixed)")
+def create_presentations(jobs, max_workers: int = None):
+    """
+    Create several presentations in parallel, one worker process per deck.
 
-        # Thank You slide
-        slide_num += 1
-        slide = add_slide(prs, "thank_you")
-        set_text_simple(slide.placeholders[0], "THANK YOU")
-        set_text_simple(slide.placeholders[1], outline.get("thank_you_subtitle", ""))
-        add_dissolve_animations(slide)
-        print(f"{slide_num}. Thank You")
+    Args:
+        jobs: Iterable of (outline, output_path) pairs.
+        max_workers: Number of worker processes. Defaults to the CPU count.
+
+    Slides within a deck are built serially — add_slide() mutates the shared
+    package — so the deck is the unit of parallelism. A single job runs in
+    this process without starting a pool. Workers receive the current
+    settings (TEMPLATE_PATH, LAYOUTS, ...) and log level from this process.
+
+    Under the spawn and forkserver start methods (the defaults on macOS,
+    Windows and Python 3.14+ Linux) workers must be able to import this
+    module: run it as a script, or put it on sys.path under an importable
+    name. If the module was loaded by file path instead, the decks are
+    built serially in this process.
+    """
+    jobs = list(jobs)
+    if len(jobs) < 2 or not _workers_can_import():
+        if len(jobs) >= 2:
+            log.warning("Module %r is not importable by worker processes; building decks serially", __name__)
+        for outline, output_path in jobs:
+            create_presentation(outline, output_path)
+        return
 
-        # Save
-        prs.save(str(output_path))
-        print(f"\nSaved: {output_path}")
-        print(f"Total slides: {len(prs.slides)}")
+    config = {name: globals()[name] for name in _WORKER_CONFIG}
+    config["ACCENT_COLOUR"] = str(ACCENT_COLOUR)  # RGBColor does not pickle
+    initargs = (config, log.getEffectiveLevel())
 
-    finally:
-        if tmp_path.exists():
-            tmp_path.unlink()
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=initargs) as pool:
+        futures = [pool.submit(create_presentation, outline, output_path) for outline, output_path in jobs]
+        for future in futures:
+            future.result()  # Re-raise any worker error
 
 
 # =============================================================================
@@ -639,4 +850,5 @@ def create_presentation(outline: dict = None, output_path: Path = None):
 # =============================================================================
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[_StdoutHandler()])
     create_presentation()